@@ -2,7 +2,7 @@
 Mountain Viewer — PySide6
 
 This update adds:
- - animated collapsible sidebar (smooth width animation + label hide)
+ - animated collapsible sidebar (label fade + a single width change)
  - restored polished UI style
  - Mountains page corrected: LEFT shows *full mountain information* (name, height, country, region, description, image placeholder), RIGHT shows *groups for that mountain* in chronological order (with leader shown)
  - Top center mountain combo still present; selecting a mountain updates Mountains page immediately
@@ -16,16 +16,38 @@ Adjust BASE_URL to point to your API server.
 
 import sys
 import json
+import logging
+import time
+from collections import OrderedDict
+from functools import partial, lru_cache
 from datetime import datetime
-from PySide6.QtCore import Qt, QUrl, Slot, QDate, QSize, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QFont
+from PySide6.QtCore import (
+    Qt, QUrl, Slot, Signal, QObject, QDate, QSize, QRect, QPropertyAnimation, QParallelAnimationGroup, QEasingCurve,
+    QTimer, QAbstractListModel, QModelIndex, QRunnable, QThreadPool, QStandardPaths, QMetaObject, Q_ARG
+)
+from PySide6.QtGui import QFont, QFontMetrics, QColor, QPainter, QStandardItemModel, QStandardItem
 from PySide6.QtWidgets import (
     QApplication, QWidget, QLabel, QComboBox, QHBoxLayout, QVBoxLayout,
-    QTextEdit, QListWidget, QListWidgetItem, QFrame, QPushButton, QMessageBox,
+    QTextEdit, QListWidget, QListView, QFrame, QPushButton, QMessageBox,
     QSizePolicy, QSpacerItem, QDialog, QDialogButtonBox, QLineEdit, QFormLayout,
-    QDateEdit, QSpinBox, QStackedWidget, QGraphicsDropShadowEffect
+    QDateEdit, QSpinBox, QStackedWidget, QStyledItemDelegate, QStyle, QGraphicsOpacityEffect, QCompleter
 )
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply, QNetworkDiskCache
+
+try:  # optional: orjson works on bytes directly and is several times faster than stdlib json
+    import orjson
+    _loads, _dumps = orjson.loads, orjson.dumps
+except ImportError:
+    _loads = json.loads
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+try:  # optional: incremental decoding of big list endpoints (see APIClient.get_stream)
+    import ijson
+except ImportError:
+    ijson = None
+
+log = logging.getLogger(__name__)
 
 # ---------------------- Configuration ----------------------
 BASE_URL = "http://localhost:8180"  # <-- change to your API server
@@ -33,24 +55,64 @@ API_PREFIX = "/api/v1"
 APP_FONT = QFont("Segoe UI", 10)
 SIDEBAR_EXPANDED_WIDTH = 220
 SIDEBAR_COLLAPSED_WIDTH = 64
+SIDEBAR_ANIM_MS = 180
+COMBO_DEBOUNCE_MS = 200
+COMBO_CHUNK_SIZE = 200
+COMBO_RETRIES = 3
+COMBO_RETRY_MS = 300
+RESPONSE_CACHE_SIZE = 500
+STREAM_BATCH_SIZE = 100
+DISK_CACHE_SIZE = 50 * 1024 * 1024
+# app-wide stylesheet, parsed once; widgets opt in through dynamic properties
+APP_QSS = 'QFrame[card="true"] { background: rgba(255,255,255,0.95); border-radius:10px; }'
+NAV_ACTIVE_QSS = 'background: rgba(255,255,255,0.05);'
+NAV_IDLE_QSS = 'background: transparent;'
 
 # ---------------------- Utilities ----------------------
 
+# qurl/make_request are memoized: the set of endpoints is small and their results are never
+# mutated. Call qurl.cache_clear() and make_request.cache_clear() if BASE_URL changes at runtime.
+@lru_cache(maxsize=256)
 def qurl(path: str) -> QUrl:
     if not path.startswith('/'):
         path = '/' + path
     return QUrl(BASE_URL.rstrip('/') + path)
 
 
+@lru_cache(maxsize=256)
+def make_request(path: str, json_body: bool = False, force_network: bool = False) -> QNetworkRequest:
+    """
+    Build a request for path that reuses pooled (keep-alive / HTTP/2) connections to the API.
+    force_network bypasses the HTTP disk cache (used by explicit refreshes).
+    """
+    req = QNetworkRequest(qurl(path))
+    req.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+    req.setAttribute(QNetworkRequest.ConnectionCacheExpiryTimeoutSecondsAttribute, 120)
+    req.setRawHeader(b'Connection', b'keep-alive')
+    if json_body:
+        req.setHeader(QNetworkRequest.ContentTypeHeader, 'application/json')
+    if force_network:
+        req.setAttribute(QNetworkRequest.CacheLoadControlAttribute, QNetworkRequest.AlwaysNetwork)
+    return req
+
+
 def parse_reply_json(reply: QNetworkReply):
-    raw = reply.readAll()
     try:
-        text = bytes(raw).decode('utf-8')
-        return json.loads(text)
-    except Exception:
+        return _loads(bytes(reply.readAll()))
+    except ValueError:
         return None
 
 
+def populate_list(lw: QListWidget, texts: list):
+    """Replace the rows of lw with texts in one batch: a single insert and a single repaint."""
+    lw.setUpdatesEnabled(False); lw.blockSignals(True)
+    try:
+        lw.clear()
+        lw.addItems(texts)
+    finally:
+        lw.blockSignals(False); lw.setUpdatesEnabled(True)
+
+
 def human_name_from_climber(c: dict) -> str:
     parts = [c.get('first_name') or '', c.get('middle_name') or '', c.get('last_name') or '']
     return ' '.join([p for p in parts if p]).strip() or c.get('email') or 'Unknown'
@@ -74,7 +136,7 @@ class GroupDialog(QDialog):
     def __init__(self, parent=None, group=None, nm: QNetworkAccessManager=None):
         super().__init__(parent)
         self.group = group or {}
-        self.nm = nm
+        self.nm = nm or get_api().nm
         self.setWindowTitle('Group')
         self.setup_ui()
 
@@ -102,25 +164,25 @@ class GroupDialog(QDialog):
         if not gid:
             QMessageBox.information(self, 'Info', 'Group id not available')
             return
-        if not self.nm:
-            QMessageBox.warning(self, 'Error', 'Network manager not available')
-            return
-        req = QNetworkRequest(qurl(f"{API_PREFIX}/groups/{gid}/members"))
-        reply = self.nm.get(req)
-        reply.finished.connect(lambda r=reply: self._on_members_fetched(r))
-
-    def _on_members_fetched(self, reply: QNetworkReply):
+        # show the dialog right away and fill it in when the reply arrives
+        dlg = QDialog(self); dlg.setWindowTitle('Members'); v = QVBoxLayout(); status = QLabel('Loading members…'); lw = QListWidget()
+        v.addWidget(status); v.addWidget(lw); btns = QDialogButtonBox(QDialogButtonBox.Close); btns.rejected.connect(dlg.reject); v.addWidget(btns); dlg.setLayout(v)
+        reply = self.nm.get(make_request(f"{API_PREFIX}/groups/{gid}/members"))
+        reply.finished.connect(partial(self._on_members_fetched, reply, lw, status))
+        dlg.finished.connect(reply.abort)  # closed before the reply arrived: free the socket
+        dlg.open()
+
+    def _on_members_fetched(self, reply: QNetworkReply, lw: QListWidget, status: QLabel):
         if reply.error() != QNetworkReply.NetworkError.NoError:
-            QMessageBox.warning(self, 'Error', f'Failed to fetch members: {reply.errorString()}')
+            # also covers a dialog closed early (aborted) — the label is just not visible then
+            status.setText(f'Failed to fetch members: {reply.errorString()}')
             reply.deleteLater(); return
         data = parse_reply_json(reply)
         reply.deleteLater()
         members = data.get('members') if isinstance(data, dict) and 'members' in data else data
-        dlg = QDialog(self); dlg.setWindowTitle('Members'); v = QVBoxLayout(); lw = QListWidget()
         if isinstance(members, list):
-            for m in members:
-                lw.addItem(human_name_from_climber(m))
-        v.addWidget(lw); btns = QDialogButtonBox(QDialogButtonBox.Close); btns.rejected.connect(dlg.reject); v.addWidget(btns); dlg.setLayout(v); dlg.exec()
+            populate_list(lw, [human_name_from_climber(m) for m in members])
+        status.hide()
 
 # ---------------------- Styled widgets ----------------------
 
@@ -131,6 +193,9 @@ class IconButton(QWidget):
         self.icon_label.setFixedWidth(24)
         self.text_label = QLabel(label)
         self.text_label.setStyleSheet('color: #fff; font-weight:600;')
+        # animated by MainWindow.toggle_sidebar; fully opaque means no offscreen pass
+        self.text_fade = QGraphicsOpacityEffect(self.text_label); self.text_fade.setOpacity(1.0)
+        self.text_label.setGraphicsEffect(self.text_fade)
         lay = QHBoxLayout(); lay.setContentsMargins(8,6,8,6); lay.addWidget(self.icon_label); lay.addSpacing(8); lay.addWidget(self.text_label); lay.addStretch()
         self.setLayout(lay)
         self.setCursor(Qt.PointingHandCursor)
@@ -139,54 +204,345 @@ class IconButton(QWidget):
     def set_collapsed(self, collapsed: bool):
         self.text_label.setVisible(not collapsed)
 
-# small card for group
-class GroupCard(QFrame):
-    def __init__(self, g: dict):
-        super().__init__(); self.g = g
-        self.setStyleSheet('background: #fff; border-radius:8px;')
-        self.setGraphicsEffect(QGraphicsDropShadowEffect(blurRadius=8, xOffset=0, yOffset=2))
-        v = QVBoxLayout(); v.setContentsMargins(10,8,10,8)
-        title = QLabel(g.get('group_name') or g.get('name') or 'Group')
-        title.setStyleSheet('font-weight:700;')
-        meta = QLabel(f"Leader: {g.get('leader_name','—')}  •  Start: {g.get('ascent_start_date','—')}")
-        meta.setStyleSheet('color:#6b7280; font-size:12px;')
-        desc = QLabel((g.get('description') or '')[:180])
-        desc.setWordWrap(True)
-        v.addWidget(title); v.addWidget(meta); v.addWidget(desc)
-        self.setLayout(v)
+# groups list: plain model rows painted as cards by GroupDelegate (no per-row widgets)
+class GroupListModel(QAbstractListModel):
+    MetaRole = Qt.UserRole + 1
+    DescriptionRole = Qt.UserRole + 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # (title, meta, description, raw group dict)
+
+    def set_groups(self, groups: list):
+        self.beginResetModel()
+        self._rows = [(g.get('group_name') or g.get('name') or 'Group',
+                       f"Leader: {g.get('leader_name') or '—'}  •  Start: {g.get('ascent_start_date') or '—'}",
+                       (g.get('description') or '')[:180],
+                       g) for g in groups]
+        self.endResetModel()
+
+    def clear(self):
+        self.set_groups([])
+
+    def group_at(self, row: int) -> dict:
+        return self._rows[row][3]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole: return row[0]
+        if role == self.MetaRole: return row[1]
+        if role == self.DescriptionRole: return row[2]
+        if role == Qt.UserRole: return row[3]
+        return None
+
+class GroupDelegate(QStyledItemDelegate):
+    PAD_X, PAD_Y, GAP = 10, 8, 4
+    # paint resources shared by all rows (and delegates); fonts need a QApplication, so they are built on first use
+    SHADOW = QColor(0, 0, 0, 28)
+    CARD, CARD_HOVER = QColor('#ffffff'), QColor('#f8fafc')
+    TITLE_COLOR, META_COLOR, DESC_COLOR = QColor('#111827'), QColor('#6b7280'), QColor('#1f2937')
+    _fonts = None
+
+    @classmethod
+    def _shared_fonts(cls):
+        if cls._fonts is None:
+            title = QFont(APP_FONT); title.setBold(True)
+            meta = QFont(APP_FONT); meta.setPixelSize(12)
+            desc = QFont(APP_FONT)
+            cls._fonts = (title, meta, desc, QFontMetrics(title), QFontMetrics(meta), QFontMetrics(desc))
+        return cls._fonts
+
+    def __init__(self, view: QListView):
+        super().__init__(view)
+        self.view = view
+        (self.title_font, self.meta_font, self.desc_font,
+         self.title_fm, self.meta_fm, self.desc_fm) = self._shared_fonts()
+
+    def _desc_height(self, text: str, width: int) -> int:
+        if not text:
+            return 0
+        return self.desc_fm.boundingRect(QRect(0, 0, width, 100000), Qt.TextWordWrap, text).height()
+
+    def sizeHint(self, option, index):
+        width = max(self.view.viewport().width() - 2 * self.view.spacing(), 120)
+        text_w = width - 2 - 2 * self.PAD_X
+        h = 2 * self.PAD_Y + self.title_fm.height() + self.GAP + self.meta_fm.height()
+        desc_h = self._desc_height(index.data(GroupListModel.DescriptionRole), text_w)
+        if desc_h:
+            h += self.GAP + desc_h
+        return QSize(width, h + 4)  # + card inset and shadow offset
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        card = option.rect.adjusted(1, 1, -1, -3)
+        # flat offset shadow: no QGraphicsEffect offscreen render per row
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.SHADOW)
+        painter.drawRoundedRect(card.translated(0, 2), 8, 8)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        painter.setBrush(self.CARD_HOVER if hovered else self.CARD)
+        painter.drawRoundedRect(card, 8, 8)
+
+        text = card.adjusted(self.PAD_X, self.PAD_Y, -self.PAD_X, -self.PAD_Y)
+        x, y, w = text.left(), text.top(), text.width()
+        painter.setFont(self.title_font); painter.setPen(self.TITLE_COLOR)
+        painter.drawText(QRect(x, y, w, self.title_fm.height()), Qt.AlignLeft | Qt.AlignVCenter,
+                         self.title_fm.elidedText(index.data(Qt.DisplayRole), Qt.ElideRight, w))
+        y += self.title_fm.height() + self.GAP
+        painter.setFont(self.meta_font); painter.setPen(self.META_COLOR)
+        painter.drawText(QRect(x, y, w, self.meta_fm.height()), Qt.AlignLeft | Qt.AlignVCenter,
+                         self.meta_fm.elidedText(index.data(GroupListModel.MetaRole), Qt.ElideRight, w))
+        y += self.meta_fm.height() + self.GAP
+        desc = index.data(GroupListModel.DescriptionRole)
+        if desc:
+            painter.setFont(self.desc_font); painter.setPen(self.DESC_COLOR)
+            painter.drawText(QRect(x, y, w, text.bottom() - y + 1), Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, desc)
+        painter.restore()
 
 # ---------------------- API wrapper ----------------------
 
+class _JsonRelay(QObject):
+    """Carries a parsed payload from a pool thread back to the GUI thread."""
+    parsed = Signal(object)
+
+    def __init__(self, cb, parent: QObject):
+        super().__init__(parent)
+        self._cb = cb
+        self.parsed.connect(self._deliver, Qt.QueuedConnection)
+
+    @Slot(object)
+    def _deliver(self, data):
+        self._cb(data)
+        self.deleteLater()
+
+class JsonParseTask(QRunnable):
+    """Decodes a json payload on a QThreadPool thread; on_parsed(data) runs on the GUI thread."""
+    def __init__(self, payload: bytes, on_parsed, parent: QObject):
+        super().__init__()
+        self.payload = payload
+        self.relay = _JsonRelay(on_parsed, parent)  # created here, so it lives in the GUI thread
+
+    def run(self):
+        try:
+            data = _loads(self.payload)
+        except ValueError:
+            data = None
+        self.relay.parsed.emit(data)
+
+
+class _JsonStream:
+    """Incremental ijson decoder for a reply whose body is a json array; emits items in batches."""
+    def __init__(self, on_items, batch: int):
+        self.items = ijson.sendable_list()
+        self.coro = ijson.items_coro(self.items, 'item')
+        self.on_items = on_items
+        self.batch = batch
+        self.failed = False
+
+    def feed(self, chunk: bytes):
+        if self.failed or not chunk:
+            return
+        try:
+            self.coro.send(chunk)
+        except ijson.JSONError:
+            self.failed = True; return
+        if len(self.items) >= self.batch:
+            self.flush()
+
+    def flush(self):
+        if self.items:
+            self.on_items(list(self.items)); del self.items[:]
+
+    def close(self):
+        if not self.failed:
+            try:
+                self.coro.close()
+            except ijson.JSONError:
+                self.failed = True
+        self.flush()
+
 class APIClient:
     def __init__(self, nm: QNetworkAccessManager):
         self.nm = nm
+        # endpoint -> (monotonic timestamp, parsed json); LRU-ordered, see get_json
+        self._cache = OrderedDict()
+        # bumped by invalidate(); views holding on to fetched data compare it to notice writes
+        self.generation = 0
+        # endpoint prefix -> ttl in seconds; first matching prefix wins
+        self._ttl = {'/mountains/stats': 60, '/mountains/': 30}
+        # endpoint -> (running reply, callbacks waiting for it) of get_json requests;
+        # concurrent gets of one endpoint share a reply, and stale ones can be aborted
+        self._inflight = {}
+        # endpoint -> running reply of get_stream requests
+        self._streams = {}
+
+    def _ttl_for(self, endpoint: str) -> float:
+        for prefix, ttl in self._ttl.items():
+            if endpoint.startswith(prefix):
+                return ttl
+        return 0
+
+    def get_json(self, endpoint: str, cb, parse_async: bool = False, fresh: bool = False):
+        """
+        GET endpoint and call cb(data, err) with the parsed json.
+        err is None on success, otherwise the failed QNetworkReply (data is None then).
+        Responses of endpoints listed in self._ttl are cached and served without a network
+        round-trip while fresh; the callback still runs from the event loop, never inline.
+        A get of an endpoint that is already in flight joins that request instead of firing another.
+        parse_async decodes the body on the global QThreadPool (for large list payloads).
+        fresh skips both caches and always goes to the server; a request already in flight
+        is replaced and its callbacks get the fresh response.
+        """
+        callbacks = [cb]
+        if fresh:
+            pending = self._inflight.pop(endpoint, None)
+            if pending is not None:
+                pending[0].abort()
+                callbacks = pending[1] + callbacks
+        else:
+            hit = self._cache.get(endpoint)
+            if hit is not None and time.monotonic() - hit[0] < self._ttl_for(endpoint):
+                self._cache.move_to_end(endpoint)
+                QTimer.singleShot(0, lambda data=hit[1]: cb(data, None))
+                return None
+            pending = self._inflight.get(endpoint)
+            if pending is not None:
+                pending[1].append(cb)
+                return pending[0]
+        reply = self.get(endpoint, partial(self._on_json_fetched, endpoint, parse_async), fresh=fresh)
+        self._inflight[endpoint] = (reply, callbacks)
+        return reply
+
+    def _on_json_fetched(self, endpoint: str, parse_async: bool, reply: QNetworkReply):
+        pending = self._inflight.get(endpoint)
+        if pending is None or pending[0] is not reply:
+            reply.deleteLater(); return  # aborted via abort(): nobody waits for it any more
+        del self._inflight[endpoint]
+        callbacks = pending[1]
+        if reply.error() != QNetworkReply.NetworkError.NoError:
+            for cb in callbacks:
+                cb(None, reply)
+            reply.deleteLater(); return
+        if parse_async:
+            payload = bytes(reply.readAll()); reply.deleteLater()
+            QThreadPool.globalInstance().start(JsonParseTask(payload, partial(self._on_json_parsed, endpoint, callbacks), self.nm))
+            return
+        data = parse_reply_json(reply); reply.deleteLater()
+        self._on_json_parsed(endpoint, callbacks, data)
+
+    def _on_json_parsed(self, endpoint: str, callbacks: list, data):
+        if data is not None and self._ttl_for(endpoint):
+            self._cache[endpoint] = (time.monotonic(), data)
+            self._cache.move_to_end(endpoint)
+            if len(self._cache) > RESPONSE_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        for cb in callbacks:
+            cb(data, None)
+
+    def get_stream(self, endpoint: str, on_items, on_done, batch: int = STREAM_BATCH_SIZE, fresh: bool = False):
+        """
+        GET an endpoint returning a json array and pass its items to on_items(list) in batches
+        while the body is still downloading; on_done(err) follows the last batch (err as in get_json).
+        Without ijson the body is parsed on the thread pool and delivered as a single batch.
+        fresh bypasses the HTTP disk cache, as in get_json.
+        """
+        if ijson is None:
+            def done(data, err):
+                if err is None and isinstance(data, list):
+                    on_items(data)
+                on_done(err)
+            return self.get_json(endpoint, done, parse_async=True, fresh=fresh)
+        reply = self.nm.get(make_request(f"{API_PREFIX}{endpoint}", force_network=fresh))
+        stream = _JsonStream(on_items, batch)
+        reply.readyRead.connect(partial(self._on_stream_chunk, stream, reply))
+        reply.finished.connect(partial(self._on_stream_finished, endpoint, stream, on_done, reply))
+        self._streams[endpoint] = reply
+        return reply
+
+    @staticmethod
+    def _on_stream_chunk(stream: _JsonStream, reply: QNetworkReply):
+        stream.feed(bytes(reply.readAll()))
 
-    def get(self, endpoint: str, cb):
-        req = QNetworkRequest(qurl(f"{API_PREFIX}{endpoint}"))
+    def _on_stream_finished(self, endpoint: str, stream: _JsonStream, on_done, reply: QNetworkReply):
+        if self._streams.get(endpoint) is not reply:
+            reply.deleteLater(); return  # aborted
+        del self._streams[endpoint]
+        if reply.error() != QNetworkReply.NetworkError.NoError:
+            on_done(reply); reply.deleteLater(); return
+        stream.feed(bytes(reply.readAll()))
+        stream.close()
+        on_done(None); reply.deleteLater()
+
+    def abort(self, *endpoints: str):
+        """Abort running get_json/get_stream requests for the given endpoints; their callbacks are not called."""
+        for endpoint in endpoints:
+            pending = self._inflight.pop(endpoint, None)
+            if pending is not None:
+                pending[0].abort()
+            reply = self._streams.pop(endpoint, None)
+            if reply is not None:
+                reply.abort()
+
+    def invalidate(self, prefix: str = ''):
+        """Drop cached responses whose endpoint starts with prefix (all of them by default)."""
+        self.generation += 1
+        for key in [k for k in self._cache if k.startswith(prefix)]:
+            del self._cache[key]
+
+    @staticmethod
+    def _dispatch(cb, reply: QNetworkReply):
+        cb(reply)
+
+    def get(self, endpoint: str, cb, fresh: bool = False):
+        req = make_request(f"{API_PREFIX}{endpoint}", force_network=fresh)
         reply = self.nm.get(req)
-        reply.finished.connect(lambda r=reply: cb(r))
+        reply.finished.connect(partial(self._dispatch, cb, reply))
         return reply
 
     def post(self, endpoint: str, payload: dict, cb):
-        req = QNetworkRequest(qurl(f"{API_PREFIX}{endpoint}"))
-        req.setHeader(QNetworkRequest.ContentTypeHeader, 'application/json')
-        reply = self.nm.post(req, json.dumps(payload).encode('utf-8'))
-        reply.finished.connect(lambda r=reply: cb(r))
+        req = make_request(f"{API_PREFIX}{endpoint}", json_body=True)
+        reply = self.nm.post(req, _dumps(payload))
+        reply.finished.connect(partial(self._dispatch, cb, reply))
         return reply
 
     def put(self, endpoint: str, payload: dict, cb):
-        req = QNetworkRequest(qurl(f"{API_PREFIX}{endpoint}"))
-        req.setHeader(QNetworkRequest.ContentTypeHeader, 'application/json')
-        reply = self.nm.put(req, json.dumps(payload).encode('utf-8'))
-        reply.finished.connect(lambda r=reply: cb(r))
+        req = make_request(f"{API_PREFIX}{endpoint}", json_body=True)
+        reply = self.nm.put(req, _dumps(payload))
+        reply.finished.connect(partial(self._dispatch, cb, reply))
         return reply
 
     def delete(self, endpoint: str, cb):
-        req = QNetworkRequest(qurl(f"{API_PREFIX}{endpoint}"))
+        req = make_request(f"{API_PREFIX}{endpoint}")
         reply = self.nm.deleteResource(req)
-        reply.finished.connect(lambda r=reply: cb(r))
+        reply.finished.connect(partial(self._dispatch, cb, reply))
         return reply
 
+_api = None
+
+def get_api() -> APIClient:
+    """
+    The application-wide APIClient. Everything shares its QNetworkAccessManager, i.e. one
+    connection pool (keep-alive / HTTP/2 reuse across pages), one disk cache and one response cache.
+    Must be called after QApplication is created.
+    """
+    global _api
+    if _api is None:
+        nm = QNetworkAccessManager(QApplication.instance())
+        nm.setTransferTimeout(15000)
+        # persistent HTTP cache: QNAM revalidates with ETag / Last-Modified across app launches
+        disk_cache = QNetworkDiskCache(nm)
+        disk_cache.setCacheDirectory(QStandardPaths.writableLocation(QStandardPaths.CacheLocation))
+        disk_cache.setMaximumCacheSize(DISK_CACHE_SIZE)
+        nm.setCache(disk_cache)
+        _api = APIClient(nm)
+    return _api
+
 # ---------------------- Mountains page (fixed) ----------------------
 
 class MountainsPage(QWidget):
@@ -194,12 +550,17 @@ class MountainsPage(QWidget):
         super().__init__()
         self.api = api
         self.current_mountain = None
+        self._loading_id = None
+        self._last_groups = None  # sorted groups of the shown mountain, None until loaded
+        self._groups_generation = 0  # api.generation when _last_groups was fetched
+        # whether the backend answers /mountains/{id}?include=groups; None until the first load tells
+        self._bundle_supported = None
         self.setup_ui()
 
     def setup_ui(self):
         root = QHBoxLayout(); root.setSpacing(16)
         # LEFT: full mountain info
-        left_card = QFrame(); left_card.setStyleSheet('background: rgba(255,255,255,0.95); border-radius:10px;')
+        self.left_card = left_card = QFrame(); left_card.setProperty('card', True)
         left_layout = QVBoxLayout(); left_layout.setContentsMargins(14,14,14,14)
         hdr = QLabel('<b>Mountain information</b>'); hdr.setStyleSheet('font-size:16px;')
         left_layout.addWidget(hdr)
@@ -223,11 +584,18 @@ class MountainsPage(QWidget):
         left_card.setLayout(left_layout)
 
         # RIGHT: groups list (chronological)
-        right_card = QFrame(); right_card.setStyleSheet('background: rgba(255,255,255,0.95); border-radius:10px;')
+        right_card = QFrame(); right_card.setProperty('card', True)
         right_layout = QVBoxLayout(); right_layout.setContentsMargins(12,12,12,12)
         right_layout.addWidget(QLabel('<b>Groups (chronological)</b>'))
-        self.groups_list = QListWidget(); self.groups_list.setSpacing(8)
-        self.groups_list.itemClicked.connect(self.on_group_click)
+        self.groups_model = GroupListModel(self)
+        self.groups_list = QListView(); self.groups_list.setSpacing(8)
+        self.groups_list.setModel(self.groups_model)
+        self.groups_list.setItemDelegate(GroupDelegate(self.groups_list))
+        self.groups_list.setResizeMode(QListView.Adjust)
+        self.groups_list.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.groups_list.setSelectionMode(QListView.NoSelection)
+        self.groups_list.setMouseTracking(True)
+        self.groups_list.clicked.connect(self.on_group_click)
         right_layout.addWidget(self.groups_list)
         right_card.setLayout(right_layout)
 
@@ -235,54 +603,88 @@ class MountainsPage(QWidget):
         root.addWidget(right_card, stretch=2)
         self.setLayout(root)
 
-    def load_mountain(self, mountain_id):
+    def load_mountain(self, mountain_id, fresh: bool = False):
+        """Show mountain_id with its groups; fresh=True (after Refresh or a write) bypasses the HTTP caches."""
         if not mountain_id:
             return
-        # fetch mountain detail
-        self.api.get(f'/mountains/{mountain_id}', self._on_mountain_detail)
-        # fetch groups
-        self.api.get(f'/mountains/{mountain_id}/groups', self._on_groups)
-
-    def _on_mountain_detail(self, reply: QNetworkReply):
-        if reply.error() != QNetworkReply.NetworkError.NoError:
-            QMessageBox.warning(self, 'Error', f'Failed to load mountain: {reply.errorString()}'); reply.deleteLater(); return
-        data = parse_reply_json(reply); reply.deleteLater()
+        prev = self._loading_id
+        if prev is not None and prev != mountain_id:
+            # a newer selection wins: free the sockets of the previous mountain's requests
+            self.api.abort(f'/mountains/{prev}?include=groups', f'/mountains/{prev}', f'/mountains/{prev}/groups')
+        if mountain_id != self._loading_id:
+            self._last_groups = None
+        self._loading_id = mountain_id
+        if self._bundle_supported is False:
+            # legacy backend: detail and groups as two parallel requests
+            self.api.get_json(f'/mountains/{mountain_id}', self._on_mountain_detail, fresh=fresh)
+            self.api.get_json(f'/mountains/{mountain_id}/groups', self._on_groups, fresh=fresh)
+            return
+        # fetch mountain detail together with its groups in one round-trip
+        self.api.get_json(f'/mountains/{mountain_id}?include=groups',
+                          partial(self._on_mountain_bundle, mountain_id, fresh), fresh=fresh)
+
+    def _on_mountain_bundle(self, mountain_id, fresh: bool, data, err: QNetworkReply):
+        if err is not None:
+            if self._bundle_supported is None and err.attribute(QNetworkRequest.HttpStatusCodeAttribute) == 404:
+                # either a backend without ?include=groups support or a missing mountain:
+                # the plain detail request tells them apart (and reports a missing mountain once)
+                self.api.get_json(f'/mountains/{mountain_id}', partial(self._on_legacy_detail, mountain_id, fresh), fresh=fresh)
+                return
+            self._on_mountain_detail(None, err); return
+        self._on_mountain_detail(data, None)
+        groups = data.get('groups') if isinstance(data, dict) else None
+        if isinstance(groups, list):
+            self._bundle_supported = True
+            self._on_groups(groups, None)
+        else:
+            # include param ignored by the server — groups need their own request, from now on in parallel
+            self._bundle_supported = False
+            self.api.get_json(f'/mountains/{mountain_id}/groups', self._on_groups, fresh=fresh)
+
+    def _on_legacy_detail(self, mountain_id, fresh: bool, data, err: QNetworkReply):
+        if err is None:
+            self._bundle_supported = False
+            self.api.get_json(f'/mountains/{mountain_id}/groups', self._on_groups, fresh=fresh)
+        self._on_mountain_detail(data, err)
+
+    def _on_mountain_detail(self, data, err: QNetworkReply):
+        if err is not None:
+            QMessageBox.warning(self, 'Error', f'Failed to load mountain: {err.errorString()}'); return
         if not isinstance(data, dict): return
         self.current_mountain = data
-        self.name_lbl.setText(f"Name: {data.get('name','—')}")
-        self.height_lbl.setText(f"Height: {data.get('height','—')}")
-        self.country_lbl.setText(f"Country: {data.get('country','—')}")
-        self.region_lbl.setText(f"Region: {data.get('region','—')}")
-        self.desc.setPlainText(data.get('description',''))
+        self._show_info(data)
 
-    def _on_groups(self, reply: QNetworkReply):
-        if reply.error() != QNetworkReply.NetworkError.NoError:
-            QMessageBox.warning(self, 'Error', f'Failed to load groups: {reply.errorString()}'); reply.deleteLater(); return
-        data = parse_reply_json(reply); reply.deleteLater()
-        self.groups_list.clear()
+    def _show_info(self, data: dict):
+        # one repaint of the card for all fields instead of one per label
+        self.left_card.setUpdatesEnabled(False)
+        try:
+            self.name_lbl.setText(f"Name: {data.get('name','—')}")
+            self.height_lbl.setText(f"Height: {data.get('height','—')}")
+            self.country_lbl.setText(f"Country: {data.get('country','—')}")
+            self.region_lbl.setText(f"Region: {data.get('region','—')}")
+            self.desc.setPlainText(data.get('description',''))
+        finally:
+            self.left_card.setUpdatesEnabled(True)
+
+    def _on_groups(self, data, err: QNetworkReply):
+        if err is not None:
+            self._last_groups = None
+            QMessageBox.warning(self, 'Error', f'Failed to load groups: {err.errorString()}'); return
         if not isinstance(data, list):
+            self._last_groups = None
+            self.groups_model.clear()
             return
-        # ensure chronological: sort by ascent_start_date ascending
-        try:
-            data_sorted = sorted(data, key=lambda x: x.get('ascent_start_date') or '')
-        except Exception:
-            data_sorted = data
-        for g in data_sorted:
-            # build display text
-            title = g.get('group_name') or g.get('name') or 'Group'
-            leader = g.get('leader_name') or '—'
-            start = g.get('ascent_start_date') or '—'
-            status = g.get('ascent_status') or '—'
-            members_count = g.get('members_count') or g.get('total_members_count') or '—'
-            item = QListWidgetItem()
-            widget = GroupCard({'group_name': title, 'leader_name': leader, 'ascent_start_date': start, 'description': g.get('description','')})
-            item.setSizeHint(widget.sizeHint())
-            item.setData(Qt.UserRole, g)
-            self.groups_list.addItem(item)
-            self.groups_list.setItemWidget(item, widget)
-
-    def on_group_click(self, item: QListWidgetItem):
-        g = item.data(Qt.UserRole)
+        # ensure chronological: sort by ascent_start_date ascending, undated groups last;
+        # the index tiebreaker keeps the sort stable without ever comparing dicts
+        keyed = [(g.get('ascent_start_date') or '\uffff', i, g) for i, g in enumerate(data) if isinstance(g, dict)]
+        keyed.sort()
+        data_sorted = [k[2] for k in keyed]
+        self._last_groups = data_sorted
+        self._groups_generation = self.api.generation
+        self.groups_model.set_groups(data_sorted)
+
+    def on_group_click(self, index: QModelIndex):
+        g = self.groups_model.group_at(index.row())
         dlg = GroupDialog(self, group=g, nm=self.api.nm)
         dlg.exec()
 
@@ -302,38 +704,33 @@ class MountainsPage(QWidget):
         туда (MainWindow.load_mountain_combo), чтобы не дублировать логику.
         В противном случае — сами запрашиваем /mountains/ и обновляем UI.
         """
+        # Явное обновление — не отдаём закэшированный ответ (ни из памяти, ни с диска)
+        self.api.invalidate('/mountains/')
         # Попробуем делегировать MainWindow (он уже знает, как правильно заполнить combo)
         wnd = self.window()
         if wnd is not None and hasattr(wnd, 'load_mountain_combo'):
             try:
-                wnd.load_mountain_combo()
+                wnd.load_mountain_combo(fresh=True)
                 return
             except Exception:
                 # на случай, если вызов не удался — падать не будем, ниже будет fallback
                 pass
 
                 # Fallback: самостоятельно загрузим список гор и подгрузим подходящую (или первую) гору
-        self.api.get('/mountains/', self._on_refresh_fetched)
+        self.api.get_json('/mountains/', self._on_refresh_fetched, fresh=True)
 
-    def _on_refresh_fetched(self, reply: QNetworkReply):
-        if reply.error() != QNetworkReply.NetworkError.NoError:
-            QMessageBox.warning(self, 'Error', f'Failed to refresh mountains: {reply.errorString()}')
-            reply.deleteLater()
+    def _on_refresh_fetched(self, data, err: QNetworkReply):
+        if err is not None:
+            QMessageBox.warning(self, 'Error', f'Failed to refresh mountains: {err.errorString()}')
             return
 
-        data = parse_reply_json(reply)
-        reply.deleteLater()
-
         mountains = data if isinstance(data, list) else []
         # Если гор нет — очистим UI
         if not mountains:
             self.current_mountain = None
-            self.name_lbl.setText('Name: —')
-            self.height_lbl.setText('Height: —')
-            self.country_lbl.setText('Country: —')
-            self.region_lbl.setText('Region: —')
-            self.desc.clear()
-            self.groups_list.clear()
+            self._show_info({})
+            self._last_groups = None
+            self.groups_model.clear()
             return
 
         # Если текущая гора всё ещё присутствует в списке — просто её перезагрузим
@@ -344,33 +741,37 @@ class MountainsPage(QWidget):
         ids = [m.get('id') for m in mountains]
         if current_id and current_id in ids:
             # подгрузим детали для текущей выбранной горы
-            self.load_mountain(current_id)
+            self.load_mountain(current_id, fresh=True)
             return
 
         # Иначе — подгрузим первую гору из списка (fallback)
         first_mid = mountains[0].get('id')
         if first_mid:
-            self.load_mountain(first_mid)
+            self.load_mountain(first_mid, fresh=True)
 
 
     def _on_added(self, reply: QNetworkReply):
         if reply.error() != QNetworkReply.NetworkError.NoError:
             QMessageBox.warning(self, 'Error', f'Create failed: {reply.errorString()}'); reply.deleteLater(); return
         QMessageBox.information(self, 'Success', 'Mountain created'); reply.deleteLater()
+        self.api.invalidate('/mountains/')
         self.on_refresh()  # автообновление после добавления
 
     def on_edit(self):
         if not self.current_mountain:
             QMessageBox.information(self, 'Info', 'No mountain selected')
             return
+        # check groups exist; the list shown on the page is up to date unless something was written since
+        if self._last_groups is not None and self._groups_generation == self.api.generation:
+            self._on_check_groups_before_edit(self._last_groups, None)
+            return
         mid = self.current_mountain.get('id')
-        # check groups exist
-        self.api.get(f'/mountains/{mid}/groups', lambda r: self._on_check_groups_before_edit(r))
+        # unknown or possibly stale after a write: ask the server, not the HTTP cache
+        self.api.get_json(f'/mountains/{mid}/groups', self._on_check_groups_before_edit, fresh=True)
 
-    def _on_check_groups_before_edit(self, reply: QNetworkReply):
-        if reply.error() != QNetworkReply.NetworkError.NoError:
-            QMessageBox.warning(self, 'Error', f'Failed: {reply.errorString()}'); reply.deleteLater(); return
-        data = parse_reply_json(reply); reply.deleteLater()
+    def _on_check_groups_before_edit(self, data, err: QNetworkReply):
+        if err is not None:
+            QMessageBox.warning(self, 'Error', f'Failed: {err.errorString()}'); return
         if isinstance(data, list) and len(data) > 0:
             QMessageBox.information(self, 'Info', 'Cannot edit mountain: ascents exist for this mountain')
             return
@@ -387,45 +788,63 @@ class MountainsPage(QWidget):
         if reply.error() != QNetworkReply.NetworkError.NoError:
             QMessageBox.warning(self, 'Error', f'Update failed: {reply.errorString()}'); reply.deleteLater(); return
         QMessageBox.information(self, 'Success', 'Mountain updated'); reply.deleteLater()
+        self.api.invalidate('/mountains/')
         self.on_refresh()  # автообновление после обновления
 
 # ---------------------- Minimal other pages (kept concise) ----------------------
 
 class ClimbersPage(QWidget):
     def __init__(self, api: APIClient):
-        super().__init__(); self.api = api; self.setup_ui()
+        super().__init__(); self.api = api
+        self._gen = 0; self._endpoint = None; self._got_rows = False
+        self.setup_ui()
     def setup_ui(self):
         v = QVBoxLayout(); h = QHBoxLayout(); h.addWidget(QLabel('<b>Climbers</b>'))
-        self.btn_range = QPushButton('Filter by date range'); self.btn_range.clicked.connect(self.by_range); self.btn_refresh = QPushButton('Refresh'); self.btn_refresh.clicked.connect(self.refresh)
+        self.btn_range = QPushButton('Filter by date range'); self.btn_range.clicked.connect(self.by_range); self.btn_refresh = QPushButton('Refresh'); self.btn_refresh.clicked.connect(self.on_refresh)
         h.addWidget(self.btn_range); h.addWidget(self.btn_refresh); v.addLayout(h)
         self.list = QListWidget(); v.addWidget(self.list); self.setLayout(v)
     def refresh(self):
-        self.api.get('/climbers/', self._on_fetched)
-    def _on_fetched(self, r: QNetworkReply):
-        if r.error() != QNetworkReply.NetworkError.NoError: QMessageBox.warning(self,'Error',r.errorString()); r.deleteLater(); return
-        data = parse_reply_json(r); r.deleteLater(); self.list.clear()
-        if isinstance(data, list):
-            for c in data: self.list.addItem(f"{human_name_from_climber(c)} — {c.get('email','')}")
+        self._load('/climbers/')
+    def on_refresh(self):
+        self._load('/climbers/', fresh=True)
+    def _load(self, endpoint: str, fresh: bool = False):
+        # rows are streamed in batch by batch; a newer load supersedes (and aborts) the previous one
+        if self._endpoint: self.api.abort(self._endpoint)
+        self._gen += 1; self._endpoint = endpoint; self._got_rows = False
+        self.api.get_stream(endpoint, partial(self._on_batch, self._gen), partial(self._on_done, self._gen), fresh=fresh)
+    def on_hidden(self):
+        # nobody sees the list behind another page: stop streaming it (switching back refreshes)
+        if self._endpoint: self.api.abort(self._endpoint)
+        self._gen += 1; self._endpoint = None
+    def _on_batch(self, gen, items):
+        if gen != self._gen: return
+        if not self._got_rows: self.list.clear(); self._got_rows = True
+        self.list.addItems([f"{human_name_from_climber(c)} — {c.get('email','')}" for c in items])
+    def _on_done(self, gen, err):
+        if gen != self._gen: return
+        self._endpoint = None
+        if err is not None: QMessageBox.warning(self,'Error',err.errorString()); return
+        if not self._got_rows: self.list.clear()
     def by_range(self):
         dlg = QDialog(self); dlg.setWindowTitle('Climbers by date range'); lay = QVBoxLayout(); form = QFormLayout(); s = QDateEdit(); s.setCalendarPopup(True); s.setDate(QDate.currentDate().addMonths(-1)); e = QDateEdit(); e.setCalendarPopup(True); e.setDate(QDate.currentDate()); form.addRow('Start', s); form.addRow('End', e); lay.addLayout(form); btns = QDialogButtonBox(QDialogButtonBox.Ok|QDialogButtonBox.Cancel); btns.accepted.connect(dlg.accept); btns.rejected.connect(dlg.reject); lay.addWidget(btns); dlg.setLayout(lay)
         if dlg.exec() == QDialog.Accepted:
-            ss = s.date().toString('yyyy-MM-dd'); ee = e.date().toString('yyyy-MM-dd'); self.api.get(f'/climbers/by-date-range?start={ss}&end={ee}', self._on_fetched)
+            ss = s.date().toString('yyyy-MM-dd'); ee = e.date().toString('yyyy-MM-dd'); self._load(f'/climbers/by-date-range?start={ss}&end={ee}', fresh=True)
 
 class GroupsPage(QWidget):
     def __init__(self, api: APIClient): super().__init__(); self.api = api; self.setup_ui()
-    def setup_ui(self): v = QVBoxLayout(); h = QHBoxLayout(); h.addWidget(QLabel('<b>Groups</b>')); btn_add = QPushButton('Add'); btn_add.clicked.connect(self.add); btn_refresh = QPushButton('Refresh'); btn_refresh.clicked.connect(self.refresh); h.addWidget(btn_add); h.addWidget(btn_refresh); v.addLayout(h); self.list = QListWidget(); v.addWidget(self.list); self.setLayout(v)
-    def refresh(self): self.api.get('/groups/', self._on_fetched)
+    def setup_ui(self): v = QVBoxLayout(); h = QHBoxLayout(); h.addWidget(QLabel('<b>Groups</b>')); btn_add = QPushButton('Add'); btn_add.clicked.connect(self.add); btn_refresh = QPushButton('Refresh'); btn_refresh.clicked.connect(self.on_refresh); h.addWidget(btn_add); h.addWidget(btn_refresh); v.addLayout(h); self.list = QListWidget(); v.addWidget(self.list); self.setLayout(v)
+    def refresh(self, fresh: bool = False): self.api.get('/groups/', self._on_fetched, fresh=fresh)
+    def on_refresh(self): self.refresh(fresh=True)
     def _on_fetched(self, r):
         if r.error() != QNetworkReply.NetworkError.NoError: QMessageBox.warning(self,'Error',r.errorString()); r.deleteLater(); return
-        data = parse_reply_json(r); r.deleteLater(); self.list.clear();
-        if isinstance(data, list):
-            for g in data: self.list.addItem(f"{g.get('name')} — leader:{g.get('leader_id')}")
+        data = parse_reply_json(r); r.deleteLater()
+        populate_list(self.list, [f"{g.get('name')} — leader:{g.get('leader_id')}" for g in data] if isinstance(data, list) else [])
     def add(self):
         # minimal add (reuses earlier pattern)
-        self.api.get('/mountains/', lambda r: self._prep_add(r))
-    def _prep_add(self, r):
-        if r.error() != QNetworkReply.NetworkError.NoError: QMessageBox.warning(self,'Error',r.errorString()); r.deleteLater(); return
-        mountains = parse_reply_json(r) or []; r.deleteLater(); dlg = SimpleFormDialog('Add group', self)
+        self.api.get_json('/mountains/', self._prep_add)
+    def _prep_add(self, mountains, err):
+        if err is not None: QMessageBox.warning(self,'Error',err.errorString()); return
+        mountains = mountains or []; dlg = SimpleFormDialog('Add group', self)
         name = QLineEdit(); desc = QLineEdit(); leader = QSpinBox(); leader.setRange(0,100000); start = QDateEdit(); start.setCalendarPopup(True); start.setDate(QDate.currentDate())
         mc = QComboBox(); mc.addItem('Select', -1)
         for m in mountains: mc.addItem(f"{m.get('name')} ({m.get('country')})", m.get('id'))
@@ -434,7 +853,11 @@ class GroupsPage(QWidget):
             mid = mc.currentData();
             if mid == -1: QMessageBox.information(self,'Info','Select mountain'); return
             payload = {'name': name.text(), 'description': desc.text(), 'leader_id': leader.value(), 'mountain_id': mid, 'start_date': start.date().toString('yyyy-MM-dd')}
-            self.api.post('/groups/', payload, lambda rr: (QMessageBox.information(self,'Success','Group created') if rr.error()==QNetworkReply.NetworkError.NoError else QMessageBox.warning(self,'Error',rr.errorString()), rr.deleteLater(), self.refresh()))
+            self.api.post('/groups/', payload, self._on_created)
+    def _on_created(self, rr):
+        if rr.error() != QNetworkReply.NetworkError.NoError: QMessageBox.warning(self,'Error',rr.errorString()); rr.deleteLater(); return
+        rr.deleteLater(); self.api.invalidate('/mountains/')  # the mountain's groups and stats changed
+        QMessageBox.information(self,'Success','Group created'); self.refresh(fresh=True)
 
 class AscentsPage(QWidget):
     def __init__(self, api: APIClient): super().__init__(); self.api = api; self.setup_ui()
@@ -444,24 +867,27 @@ class AscentsPage(QWidget):
         dlg.setWindowTitle('Ascents by date range'); lay = QVBoxLayout(); form = QFormLayout(); s = QDateEdit(); s.setCalendarPopup(True); s.setDate(QDate.currentDate().addMonths(-1)); e = QDateEdit(); e.setCalendarPopup(True); e.setDate(QDate.currentDate()); form.addRow('Start', s); form.addRow('End', e); lay.addLayout(form); btns = QDialogButtonBox(QDialogButtonBox.Ok|QDialogButtonBox.Cancel); btns.accepted.connect(dlg.accept); btns.rejected.connect(dlg.reject); lay.addWidget(btns);
         dlg.setLayout(lay)
         if dlg.exec() == QDialog.Accepted:
-            ss = s.date().toString('yyyy-MM-dd'); ee = e.date().toString('yyyy-MM-dd'); self.api.get(f'/ascents/by-date-range?start={ss}&end={ee}', self._on_fetched)
-    def upcoming(self): self.api.get('/ascents/upcoming', self._on_fetched)
+            ss = s.date().toString('yyyy-MM-dd'); ee = e.date().toString('yyyy-MM-dd'); self.api.get(f'/ascents/by-date-range?start={ss}&end={ee}', self._on_fetched, fresh=True)
+    def upcoming(self): self.api.get('/ascents/upcoming', self._on_fetched, fresh=True)
     def _on_fetched(self, r):
         if r.error() != QNetworkReply.NetworkError.NoError: QMessageBox.warning(self,'Error',r.errorString()); r.deleteLater(); return
-        data = parse_reply_json(r); r.deleteLater(); self.list.clear()
+        data = parse_reply_json(r); r.deleteLater()
+        rows = []; add = rows.append
         if isinstance(data, list):
             for a in data:
-                mountain = a.get('mountain_name') or (a.get('mountain') or {}).get('name') or '—'
-                group = a.get('group_name') or (a.get('group') or {}).get('name') or '—'
-                self.list.addItem(f"{mountain} — {group} — {a.get('start_date')} -> {a.get('end_date')} — {a.get('status')}")
+                # short-circuit on a missing nested object instead of allocating a {} per row
+                mountain = a.get('mountain_name') or (a.get('mountain') and a['mountain'].get('name')) or '—'
+                group = a.get('group_name') or (a.get('group') and a['group'].get('name')) or '—'
+                add(f"{mountain} — {group} — {a.get('start_date')} -> {a.get('end_date')} — {a.get('status')}")
+        populate_list(self.list, rows)
 
 class StatsPage(QWidget):
     def __init__(self, api: APIClient): super().__init__(); self.api = api; self.setup_ui()
-    def setup_ui(self): v = QVBoxLayout(); h = QHBoxLayout(); h.addWidget(QLabel('<b>Stats</b>')); btn = QPushButton('Refresh'); btn.clicked.connect(self.refresh); h.addWidget(btn); v.addLayout(h); self.text = QTextEdit(); self.text.setReadOnly(True); v.addWidget(self.text); self.setLayout(v)
-    def refresh(self): self.api.get('/mountains/stats', self._on_fetched)
-    def _on_fetched(self, r):
-        if r.error() != QNetworkReply.NetworkError.NoError: QMessageBox.warning(self,'Error',r.errorString()); r.deleteLater(); return
-        data = parse_reply_json(r); r.deleteLater();
+    def setup_ui(self): v = QVBoxLayout(); h = QHBoxLayout(); h.addWidget(QLabel('<b>Stats</b>')); btn = QPushButton('Refresh'); btn.clicked.connect(self.on_refresh); h.addWidget(btn); v.addLayout(h); self.text = QTextEdit(); self.text.setReadOnly(True); v.addWidget(self.text); self.setLayout(v)
+    def refresh(self, fresh: bool = False): self.api.get_json('/mountains/stats', self._on_fetched, parse_async=True, fresh=fresh)
+    def on_refresh(self): self.api.invalidate('/mountains/stats'); self.refresh(fresh=True)
+    def _on_fetched(self, data, err):
+        if err is not None: QMessageBox.warning(self,'Error',err.errorString()); return
         if not isinstance(data, list): self.text.setPlainText('No stats'); return
         lines = []
         for m in data:
@@ -471,14 +897,26 @@ class StatsPage(QWidget):
 # ---------------------- Main Window with animated sidebar ----------------------
 
 class MainWindow(QWidget):
-    def __init__(self):
+    def __init__(self, defer_initial_load: bool = False):
+        """defer_initial_load: don't fetch the mountains list here; the caller runs load_mountain_combo later."""
         super().__init__()
+        self._defer_initial_load = defer_initial_load
         self.setWindowTitle('Alpine Club — Mountains & Ascents')
         self.setMinimumSize(1200, 760)
         self.setFont(APP_FONT)
-        self.nm = QNetworkAccessManager(self)
-        self.api = APIClient(self.nm)
+        QApplication.instance().setStyleSheet(APP_QSS)
+        self.api = get_api()
+        self.nm = self.api.nm
         self.sidebar_expanded = True
+        self._mountains = None  # last mountains list shown in the combo
+        self._combo_gen = 0  # bumped per _populate_combo; stale chunk callbacks bail out
+        self._combo_retries = 0
+        self._combo_fresh = False
+        # coalesce bursts of combo changes (arrow keys, wheel) into one mountain load
+        self._pending_mid = None; self._pending_name = None
+        self._combo_debounce = QTimer(self); self._combo_debounce.setSingleShot(True)
+        self._combo_debounce.setInterval(COMBO_DEBOUNCE_MS)
+        self._combo_debounce.timeout.connect(self._apply_combo_change)
         self.setup_ui()
 
     def setup_ui(self):
@@ -498,14 +936,25 @@ class MainWindow(QWidget):
         s_layout.addSpacing(6)
         # nav buttons (IconButton widgets)
         self.nav_buttons = {}
+        self._active_nav_key = None
+        self._refresh_pending = set()  # page keys with a deferred refresh queued
+        self._pending_switch = None  # last key passed to switch() this event loop turn
         nav_items = [('mountains','⛰️','Mountains'), ('climbers','🧗','Climbers'), ('groups','👥','Groups'), ('ascents','📅','Ascents'), ('stats','📊','Stats')]
         for key, ico, label in nav_items:
-            btn = IconButton(ico, label)
+            btn = IconButton(ico, label); btn.setStyleSheet(NAV_IDLE_QSS)
             btn.mousePressEvent = lambda ev, k=key: self.switch(k)
             s_layout.addWidget(btn)
             self.nav_buttons[key] = btn
         s_layout.addStretch()
         self.sidebar.setLayout(s_layout)
+        # one long-lived label fade, owned by the sidebar it animates and reused by every toggle
+        self._sidebar_anim = QParallelAnimationGroup(self.sidebar)
+        for btn in self.nav_buttons.values():
+            anim = QPropertyAnimation(btn.text_fade, b"opacity", self._sidebar_anim)
+            anim.setDuration(SIDEBAR_ANIM_MS)
+            anim.setEasingCurve(QEasingCurve.InOutCubic)
+            self._sidebar_anim.addAnimation(anim)
+        self._sidebar_anim.finished.connect(self._on_sidebar_anim_finished)
 
         # Main area
         main = QVBoxLayout(); main.setContentsMargins(12,12,12,12)
@@ -513,17 +962,28 @@ class MainWindow(QWidget):
         header = QHBoxLayout()
         self.title_label = QLabel('—'); self.title_label.setStyleSheet('font-size:20px; font-weight:800;')
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.mountain_combo = QComboBox(); self.mountain_combo.setMinimumWidth(340); self.mountain_combo.currentIndexChanged.connect(self.on_combo_change)
-        header.addStretch(); header.addWidget(self.title_label); header.addSpacing(12); header.addWidget(self.mountain_combo); header.addStretch()
+        self.mountain_model = QStandardItemModel(self)
+        self.mountain_combo = QComboBox(); self.mountain_combo.setModel(self.mountain_model); self.mountain_combo.setMinimumWidth(340)
+        # type to filter: the combo's completer matches anywhere in the name, case-insensitively
+        self.mountain_combo.setEditable(True); self.mountain_combo.setInsertPolicy(QComboBox.NoInsert)
+        self.mountain_combo.lineEdit().setPlaceholderText('Loading mountains…')
+        completer = self.mountain_combo.completer()
+        completer.setCaseSensitivity(Qt.CaseInsensitive); completer.setFilterMode(Qt.MatchContains); completer.setCompletionMode(QCompleter.PopupCompletion)
+        # the popup lays out rows lazily, in batches, with a single measured row height
+        popup = self.mountain_combo.view()
+        popup.setUniformItemSizes(True); popup.setLayoutMode(QListView.Batched); popup.setBatchSize(100)
+        self.mountain_combo.currentIndexChanged.connect(self.on_combo_change)
+        self.combo_status = QLabel(); self.combo_status.setStyleSheet('color:#b45309; font-size:12px;'); self.combo_status.hide()
+        header.addStretch(); header.addWidget(self.title_label); header.addSpacing(12); header.addWidget(self.mountain_combo); header.addWidget(self.combo_status); header.addStretch()
         main.addLayout(header)
         # Stacked content
         self.stack = QStackedWidget()
+        # key -> (page, bound refresh or None, nav button), filled in as pages get built;
+        # pages other than Mountains are only built when first opened
+        self._switch_table = {}
+        self._page_factories = {'climbers': ClimbersPage, 'groups': GroupsPage, 'ascents': AscentsPage, 'stats': StatsPage}
         self.page_mountains = MountainsPage(self.api)
-        self.page_climbers = ClimbersPage(self.api)
-        self.page_groups = GroupsPage(self.api)
-        self.page_ascents = AscentsPage(self.api)
-        self.page_stats = StatsPage(self.api)
-        self.stack.addWidget(self.page_mountains); self.stack.addWidget(self.page_climbers); self.stack.addWidget(self.page_groups); self.stack.addWidget(self.page_ascents); self.stack.addWidget(self.page_stats)
+        self._add_page('mountains', self.page_mountains)
         main.addWidget(self.stack)
 
         # assemble
@@ -534,74 +994,165 @@ class MainWindow(QWidget):
 
         # default
         self.switch('mountains')
-        self.load_mountain_combo()
+        if not self._defer_initial_load:
+            self.load_mountain_combo()
 
     def toggle_sidebar(self):
-        start = SIDEBAR_EXPANDED_WIDTH if self.sidebar_expanded else SIDEBAR_COLLAPSED_WIDTH
-        end = SIDEBAR_COLLAPSED_WIDTH if self.sidebar_expanded else SIDEBAR_EXPANDED_WIDTH
-        anim = QPropertyAnimation(self.sidebar, b"maximumWidth")
-        anim.setDuration(280)
-        anim.setStartValue(start)
-        anim.setEndValue(end)
-        anim.setEasingCurve(QEasingCurve.InOutCubic)
-        anim.start()
+        # Only the nav labels' opacity is animated. The width changes in a single layout pass
+        # (after the fade-out when collapsing, before the fade-in when expanding), so the window
+        # is not relayouted on every animation frame.
+        collapsing = self.sidebar_expanded
+        self._sidebar_anim.stop()
+        if not collapsing:
+            self._apply_sidebar_width(True)
+        for i in range(self._sidebar_anim.animationCount()):
+            anim = self._sidebar_anim.animationAt(i)
+            anim.setStartValue(anim.targetObject().opacity())
+            anim.setEndValue(0.0 if collapsing else 1.0)
+        self._sidebar_anim.start()
+        # change toggle sign
+        self.toggle_btn.setText('⟩' if collapsing else '⟨')
+        self.sidebar_expanded = not collapsing
+
+    def _on_sidebar_anim_finished(self):
+        if not self.sidebar_expanded:
+            self._apply_sidebar_width(False)
+
+    def _apply_sidebar_width(self, expanded: bool):
         # hide/show labels on buttons
         for btn in self.nav_buttons.values():
-            btn.set_collapsed(self.sidebar_expanded)
-        # change toggle sign
-        self.toggle_btn.setText('⟩' if self.sidebar_expanded else '⟨')
-        self.sidebar_expanded = not self.sidebar_expanded
-        # keep reference to animation so it doesn't get GC'd
-        self._sidebar_anim = anim
+            btn.set_collapsed(not expanded)
+        self.sidebar.setMaximumWidth(SIDEBAR_EXPANDED_WIDTH if expanded else SIDEBAR_COLLAPSED_WIDTH)
+
+    def _add_page(self, key: str, page: QWidget) -> tuple:
+        self.stack.addWidget(page)
+        entry = self._switch_table[key] = (page, getattr(page, 'refresh', None), self.nav_buttons[key])
+        return entry
 
     def switch(self, key: str):
-        mapping = {'mountains':0, 'climbers':1, 'groups':2, 'ascents':3, 'stats':4}
-        idx = mapping.get(key, 0)
-        self.stack.setCurrentIndex(idx)
-        page = self.stack.currentWidget()
-        if hasattr(page, 'refresh'):
-            try: page.refresh()
-            except Exception: pass
-        # style active nav
-        for k, btn in self.nav_buttons.items():
-            if k == key:
-                btn.setStyleSheet('background: rgba(255,255,255,0.05);')
-            else:
-                btn.setStyleSheet('background: transparent;')
-
-    def load_mountain_combo(self):
-        self.api.get('/mountains/', self._on_combo_loaded)
-
-    def _on_combo_loaded(self, reply: QNetworkReply):
-        if reply.error() != QNetworkReply.NetworkError.NoError:
-            reply.deleteLater(); return
-        data = parse_reply_json(reply); reply.deleteLater(); items = data if isinstance(data, list) else []
-        self.mountain_combo.blockSignals(True); self.mountain_combo.clear(); self.mountain_combo.addItem('Select mountain', -1)
-        for m in items: self.mountain_combo.addItem(f"{m.get('name')} ({m.get('country')})", m.get('id'))
-        self.mountain_combo.blockSignals(False)
+        # the UI work is queued: everything triggered in this turn settles first, and only the
+        # last requested page is applied, in one pass
+        self._pending_switch = key
+        QMetaObject.invokeMethod(self, '_do_switch_ui', Qt.QueuedConnection, Q_ARG(str, key))
+
+    @Slot(str)
+    def _do_switch_ui(self, key: str):
+        if key != self._pending_switch:
+            return  # superseded by a later switch() in the same turn
+        self._pending_switch = None
+        if key not in self._switch_table and key not in self._page_factories:
+            key = 'mountains'
+        if key == self._active_nav_key:
+            return
+        page, refresh, btn = self._switch_table.get(key) or self._add_page(key, self._page_factories[key](self.api))
+        # optional page hooks: hidden pages stop background work, the visible one resumes it
+        if self._active_nav_key is not None:
+            on_hidden = getattr(self._switch_table[self._active_nav_key][0], 'on_hidden', None)
+            if on_hidden is not None: on_hidden()
+        self.stack.setCurrentWidget(page)
+        on_visible = getattr(page, 'on_visible', None)
+        if on_visible is not None: on_visible()
+        # let the page swap paint first; the refresh runs on the next event loop turn
+        if refresh is not None and key not in self._refresh_pending:
+            self._refresh_pending.add(key)
+            QTimer.singleShot(0, partial(self._run_refresh, key, refresh))
+        # style active nav: only the previous and the new button change, painted in one go
+        self.sidebar.setUpdatesEnabled(False)
+        try:
+            if self._active_nav_key is not None:
+                self._switch_table[self._active_nav_key][2].setStyleSheet(NAV_IDLE_QSS)
+            btn.setStyleSheet(NAV_ACTIVE_QSS)
+        finally:
+            self.sidebar.setUpdatesEnabled(True)
+        self._active_nav_key = key
+
+    def _run_refresh(self, key: str, refresh):
+        self._refresh_pending.discard(key)
+        try: refresh()
+        except Exception: log.exception('Refreshing page %r failed', key)
+
+    def load_mountain_combo(self, fresh: bool = False):
+        """(Re)fill the mountain combo; fresh=True (the Refresh button) bypasses the HTTP caches."""
+        self._combo_retries = 0
+        self._combo_fresh = fresh
+        self._request_combo()
+
+    def _request_combo(self):
+        self.api.get_json('/mountains/', self._on_combo_loaded, parse_async=True, fresh=self._combo_fresh)
+
+    def _on_combo_loaded(self, data, err: QNetworkReply):
+        if err is not None:
+            # keep whatever the combo already shows and retry a few times before giving up
+            if self._combo_retries < COMBO_RETRIES:
+                self._combo_retries += 1
+                QTimer.singleShot(COMBO_RETRY_MS, self._request_combo)
+            self.combo_status.setText('Offline — using cached data' if self._mountains else 'Offline — mountains unavailable')
+            self.combo_status.show()
+            return
+        self.combo_status.hide()
+        items = data if isinstance(data, list) else []
+        if items is not self._mountains:
+            # new payload (cache hits hand back the same list): format the combo labels once
+            for m in items:
+                m['_display'] = f"{m.get('name')} ({m.get('country')})"
+        self._mountains = items
+        self._populate_combo(items)
+
+    def _populate_combo(self, items: list):
+        # the first chunk (which holds the auto-selected mountain) goes in right away,
+        # the rest is appended in COMBO_CHUNK_SIZE slices on later event loop turns
+        self._combo_gen += 1
+        self.mountain_combo.blockSignals(True); self.mountain_model.clear()
+        placeholder = QStandardItem('Select mountain'); placeholder.setData(-1, Qt.UserRole)
+        self.mountain_model.appendRow(placeholder)
+        self._append_combo_chunk(self._combo_gen, items, 0)
         if items:
-            # select first
+            # select first; signals stay blocked so on_combo_change doesn't queue a second load
             self.mountain_combo.setCurrentIndex(1)
+        self.mountain_combo.blockSignals(False)
+        if items:
+            self._combo_debounce.stop()
             self.title_label.setText(items[0].get('name') or '—')
             mid = items[0].get('id')
             if mid:
-                self.page_mountains.load_mountain(mid)
+                # a list fetched for Refresh (or after a write) loads its mountain fresh as well
+                self.page_mountains.load_mountain(mid, fresh=self._combo_fresh)
+
+    def _append_combo_chunk(self, gen: int, items: list, start: int):
+        if gen != self._combo_gen:
+            return  # superseded by a newer list
+        end = start + COMBO_CHUNK_SIZE
+        chunk = items[start:end]
+        rows = [QStandardItem(m['_display']) for m in chunk]
+        for it, m in zip(rows, chunk):
+            it.setData((m.get('id'), m.get('name')), Qt.UserRole)
+        self.mountain_model.invisibleRootItem().appendRows(rows)
+        if end < len(items):
+            QTimer.singleShot(0, partial(self._append_combo_chunk, gen, items, end))
 
     def on_combo_change(self, idx: int):
-        mid = self.mountain_combo.currentData()
-        if mid is None or mid == -1: return
-        name = self.mountain_combo.currentText().split('(')[0].strip()
-        self.title_label.setText(name)
+        payload = self.mountain_combo.currentData()  # (id, name); -1 for the placeholder
+        if not isinstance(payload, (tuple, list)): return  # the QVariant round-trip may hand back a list
+        self._pending_mid, self._pending_name = payload
+        self._combo_debounce.start()
+
+    def _apply_combo_change(self):
+        # only the last selection of a burst gets here
+        self.title_label.setText(self._pending_name or '—')
         # ensure mountains page displays selected mountain
-        self.page_mountains.load_mountain(mid)
+        self.page_mountains.load_mountain(self._pending_mid)
 
 # ---------------------- App entry ----------------------
 
 def main():
     app = QApplication(sys.argv)
+    app.setApplicationName('alpineTracker')  # scopes CacheLocation (the HTTP disk cache) to this app
     app.setStyle('Fusion')
-    w = MainWindow()
+    get_api()  # the shared network stack, before any window needs it
+    w = MainWindow(defer_initial_load=True)
     w.show()
+    # first paint happens before any network work; the mountains list is fetched right after
+    QTimer.singleShot(0, w.load_mountain_combo)
     sys.exit(app.exec())
 
 if __name__ == '__main__':